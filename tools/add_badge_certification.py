@@ -1,27 +1,39 @@
 #!/usr/bin/env python3
 """
 Interactive tool to add a new badge certification to badge_certifications.yaml
+Also supports a non-interactive --from-json mode for scripted/CI imports.
 """
 
+import os
+import json
 import yaml
+import argparse
 from pathlib import Path
-from datetime import datetime
+
+from generate_badge_certifications import (
+    Loader, Dumper, is_iso_date, compile_cert_validator, validate_certification)
+
+try:
+    import orjson  # C-accelerated decoder, optional
+except ImportError:
+    orjson = None
 
 def get_input(prompt, default='', required=True):
     """Get user input with optional default"""
     if default:
         prompt = f"{prompt} [{default}]"
 
-    value = input(f"{prompt}: ").strip()
+    while True:
+        value = input(f"{prompt}: ").strip()
 
-    if not value and default:
-        return default
+        if not value and default:
+            return default
 
-    if required and not value:
-        print("❌ This field is required!")
-        return get_input(prompt, default, required)
+        if required and not value:
+            print("❌ This field is required!")
+            continue
 
-    return value
+        return value
 
 def get_date_input(prompt, required=False):
     """Get date input in YYYY-MM-DD format"""
@@ -30,29 +42,19 @@ def get_date_input(prompt, required=False):
         if not value:
             return ''
 
-        try:
-            datetime.strptime(value, '%Y-%m-%d')
+        if is_iso_date(value):
             return value
-        except ValueError:
-            print("❌ Invalid date format. Please use YYYY-MM-DD")
-
-def main():
-    script_dir = Path(__file__).parent
-    yaml_path = script_dir / 'badge_certifications.yaml'
 
-    print("\n" + "="*60)
-    print("🏆 Add New Badge Certification")
-    print("="*60 + "\n")
+        print("❌ Invalid date format. Please use YYYY-MM-DD")
 
-    # Load existing YAML
-    try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-    except FileNotFoundError:
-        print(f"❌ Config file not found: {yaml_path}")
-        return 1
+def load_json_certs(json_path):
+    """Load one certification dict (or a list of them) from a JSON file"""
+    data = Path(json_path).read_bytes()
+    certs = orjson.loads(data) if orjson is not None else json.loads(data)
+    return certs if isinstance(certs, list) else [certs]
 
-    # Get certification details
+def prompt_certification():
+    """Collect certification fields interactively"""
     print("Enter certification details:\n")
 
     cert = {}
@@ -75,24 +77,110 @@ def main():
     cert['credential_id'] = get_input("Credential ID", required=False)
     cert['description'] = get_input("Description", required=False)
 
-    # Add to config
-    if 'certifications' not in config:
-        config['certifications'] = []
+    return cert
+
+def append_certifications(yaml_path, new_certs):
+    """Splice new entries into the certifications: block in place.
+
+    Re-dumping the whole config is O(N) parse + serialize per add and
+    strips every hand-written comment. Instead dump only the new entries
+    and insert them just before the categories: section, which follows
+    the certifications list in this file. Returns False if the expected
+    layout is not found, so the caller can fall back to a full rewrite.
+    """
+    text = yaml_path.read_text(encoding='utf-8')
+
+    for anchor in ('\n# Category Configuration', '\ncategories:'):
+        pos = text.find(anchor)
+        if pos != -1:
+            break
+    else:
+        return False
 
-    config['certifications'].append(cert)
+    block = yaml.dump(new_certs, Dumper=Dumper, default_flow_style=False,
+                      allow_unicode=True, sort_keys=False)
+    # Match the file's 2-space list indentation under certifications:
+    block = ''.join(f'  {line}\n' if line else '\n' for line in block.splitlines())
 
-    # Save YAML
-    with open(yaml_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    yaml_path.write_text(
+        text[:pos].rstrip('\n') + '\n\n' + block + text[pos:],
+        encoding='utf-8')
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Add a badge certification to badge_certifications.yaml')
+    parser.add_argument('--from-json', metavar='PATH',
+                        help='read certification fields from a JSON file (dict or list of dicts) instead of prompting')
+    parser.add_argument('--rewrite', action='store_true',
+                        help='re-dump the whole YAML file instead of appending (drops comments; use after structural edits)')
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    yaml_path = script_dir / 'badge_certifications.yaml'
+    badges_dir = script_dir.parent / 'assets' / 'badges'
 
     print("\n" + "="*60)
-    print("✅ Certification added successfully!")
+    print("🏆 Add New Badge Certification")
+    print("="*60 + "\n")
+
+    # Load existing YAML
+    try:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=Loader)
+    except FileNotFoundError:
+        print(f"❌ Config file not found: {yaml_path}")
+        return 1
+
+    if args.from_json:
+        # orjson's and json's decode errors are both ValueError subclasses
+        try:
+            new_certs = load_json_certs(args.from_json)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read certifications from {args.from_json}: {e}")
+            return 1
+
+        # Validate the batch up front with the generator's own checks
+        category_metadata = config.get('categories', {})
+        existing_badges = {e.name for e in os.scandir(badges_dir)} if badges_dir.is_dir() else set()
+        badges_dir_str = str(badges_dir)
+        validator = compile_cert_validator(category_metadata)
+
+        failed = False
+        for cert in new_certs:
+            errors, warnings = validate_certification(cert, badges_dir_str, category_metadata, existing_badges, validator)
+            title = cert.get('title', 'Unknown')
+            for error in errors:
+                print(f"❌ {title}: {error}")
+            for warning in warnings:
+                print(f"⚠️  {title}: {warning}")
+            if errors:
+                failed = True
+
+        if failed:
+            print("\n❌ No certifications added — fix the errors above and retry")
+            return 1
+    else:
+        new_certs = [prompt_certification()]
+
+    # Save YAML: append in place when possible, full rewrite as fallback
+    if args.rewrite or not append_certifications(yaml_path, new_certs):
+        if 'certifications' not in config:
+            config['certifications'] = []
+        config['certifications'].extend(new_certs)
+
+        with open(yaml_path, 'w', encoding='utf-8') as f:
+            yaml.dump(config, f, Dumper=Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+    print("\n" + "="*60)
+    print(f"✅ {len(new_certs)} certification(s) added successfully!")
     print("="*60)
     print(f"\n📄 Updated: {yaml_path}")
     print(f"\n🎯 Next Steps:")
-    print(f"   1. Add badge image: assets/badges/{cert['badge_image']}")
-    print(f"   2. Run: python3 tools/generate_badge_certifications.py")
-    print(f"   3. Commit and push changes")
+    for cert in new_certs:
+        print(f"   - Add badge image: assets/badges/{cert['badge_image']}")
+    print(f"   Then run: python3 tools/generate_badge_certifications.py")
+    print(f"   Commit and push changes")
     print("="*60 + "\n")
 
     return 0
@@ -103,4 +191,3 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         print("\n\n❌ Cancelled by user")
         exit(1)
-
@@ -1,41 +1,138 @@
 #!/usr/bin/env python3
 # tools/fetch_medium.py
-import sys, json, os, feedparser
+import sys, json, os, re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from html import unescape
-from datetime import datetime
+from urllib.request import Request, urlopen
+from xml.etree import ElementTree
 
-def excerpt_from_content(entry, length=200):
-    if 'summary' in entry and entry['summary']:
-        txt = unescape(entry['summary'])
-    elif 'content' in entry and entry['content']:
-        txt = unescape(entry['content'][0].value)
-    else:
-        txt = ''
-    txt = ' '.join(txt.split())
+try:
+    from dateutil import parser as dateutil_parser  # optional last resort
+except ImportError:
+    dateutil_parser = None
+
+# Medium puts the article body in <content:encoded>
+CONTENT_TAG = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+# Sort sentinel for items without a parseable date
+EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+# Common RFC822 zone abbreviations, precomputed once so dateutil never
+# has to guess them per call
+TZINFOS = {
+    'UT': 0, 'GMT': 0, 'UTC': 0, 'Z': 0,
+    'EST': -5 * 3600, 'EDT': -4 * 3600,
+    'CST': -6 * 3600, 'CDT': -5 * 3600,
+    'MST': -7 * 3600, 'MDT': -6 * 3600,
+    'PST': -8 * 3600, 'PDT': -7 * 3600,
+}
+
+def parse_date(value):
+    """Parse a feed date, cheapest interpreter first.
+
+    Medium emits RFC822 dates, which parsedate_to_datetime handles in C;
+    ISO-8601 goes through fromisoformat. dateutil (if installed) is the
+    slow path for anything else. Returns None when nothing matches.
+
+    Every tier can yield a naive datetime (zone-less ISO input, RFC822
+    '-0000'); normalize those to UTC so results always compare against
+    each other and the EPOCH sentinel.
+    """
+    dt = None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            if dateutil_parser is not None:
+                try:
+                    dt = dateutil_parser.parse(value, tzinfos=TZINFOS)
+                except (ValueError, OverflowError):
+                    dt = None
+
+    if dt is not None and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+_WS = re.compile(r'\s+')
+
+def excerpt_from_content(txt, length=200):
+    # Truncate before normalizing — no point unescaping a full article
+    # body for a 200-char excerpt. Over-read 4x so multibyte entities
+    # and collapsed whitespace can't shorten the text below length.
+    txt = unescape(txt[:length * 4])
+    txt = _WS.sub(' ', txt).strip()
     return (txt[:length] + '…') if len(txt) > length else txt
 
+def parse_feed(feed_url, limit=None):
+    """Stream-parse an RSS feed into a list of item dicts.
+
+    iterparse consumes the response incrementally, so we never build the
+    full DOM; each <item> is reduced to the four fields we need and then
+    cleared to free its children. With a limit, parsing stops as soon as
+    that many items are seen — the tail of the feed is never downloaded.
+    """
+    req = Request(feed_url, headers={'User-Agent': 'Mozilla/5.0'})
+    items = []
+    with urlopen(req, timeout=30) as resp:
+        for _, elem in ElementTree.iterparse(resp):
+            if elem.tag != 'item':
+                continue
+
+            pub_date = elem.findtext('pubDate')
+            date = parse_date(pub_date) if pub_date else None
+
+            items.append({
+                'title': elem.findtext('title') or 'Untitled',
+                'link': elem.findtext('link'),
+                'date': date,
+                'summary': elem.findtext('description') or elem.findtext(CONTENT_TAG) or '',
+            })
+            elem.clear()
+
+            if limit is not None and len(items) >= limit:
+                break
+    return items
+
 def main(output_path):
-    username = os.getenv('MEDIUM_USERNAME', 'vjmourya').strip()
+    # MEDIUM_USERNAMES (comma-separated) wins over the single MEDIUM_USERNAME
+    raw = os.getenv('MEDIUM_USERNAMES') or os.getenv('MEDIUM_USERNAME', 'vjmourya')
+    usernames = [u.strip() for u in raw.split(',') if u.strip()]
     max_posts = int(os.getenv('MAX_POSTS', '6'))
-    feed_url = f'https://medium.com/feed/@{username}'
-    d = feedparser.parse(feed_url)
+    feed_urls = [f'https://medium.com/feed/@{u}' for u in usernames]
+
+    # Feed fetches are network-bound, so fan out across a small thread
+    # pool; Medium feeds are newest-first, so max_posts per feed is
+    # enough to fill the merged list
+    if len(feed_urls) == 1:
+        feeds = [parse_feed(feed_urls[0], max_posts)]
+    else:
+        fetch = partial(parse_feed, limit=max_posts)
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            feeds = list(ex.map(fetch, feed_urls))
+
+    entries = [entry for items in feeds for entry in items]
+    entries.sort(key=lambda e: e['date'] or EPOCH, reverse=True)
 
     posts = []
-    for entry in d.entries[:max_posts]:
-        date = None
-        if 'published_parsed' in entry and entry.published_parsed:
-            date = datetime(*entry.published_parsed[:6]).isoformat()
+    for entry in entries[:max_posts]:
         posts.append({
-            'title': entry.get('title', 'Untitled'),
-            'link': entry.get('link'),
-            'date': date,
-            'excerpt': excerpt_from_content(entry, length=200)
+            'title': entry['title'],
+            'link': entry['link'],
+            'date': entry['date'].isoformat() if entry['date'] else None,
+            'excerpt': excerpt_from_content(entry['summary'], length=200)
         })
 
+    source = ', '.join(f'https://medium.com/@{u}' for u in usernames)
+
     # ensure output dir exists
     os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({'source': f'https://medium.com/@{username}', 'posts': posts}, f, ensure_ascii=False, indent=2)
+        json.dump({'source': source, 'posts': posts}, f, ensure_ascii=False, indent=2)
 
 if __name__ == '__main__':
     out = sys.argv[1] if len(sys.argv) > 1 else 'assets/medium_posts.json'
@@ -5,16 +5,64 @@ This script reads badge_certifications.yaml and generates badge_certifications.j
 """
 
 import os
+import re
+import sys
 import json
+import mmap
 import yaml
+import hashlib
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import quote
+from datetime import date, datetime
+
+try:
+    import orjson  # C-accelerated encoder, optional
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema  # compiles validation to straight-line code, optional
+except ImportError:
+    fastjsonschema = None
+
+# Use the libyaml C bindings when available (~10x faster parsing),
+# fall back to the pure-Python implementation otherwise
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Below this size the mmap setup cost outweighs the saved read() copies
+MMAP_THRESHOLD = 16 * 1024
+
+# Strict YYYY-MM-DD shape check; compiled once instead of re-parsing a
+# strptime format string per value
+ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Sort sentinel for certifications without an issue_date; never a valid
+# date, so it cannot collide with real data
+UNDATED = '0000-00-00'
+
+def is_iso_date(value):
+    """Check that value is a valid date in YYYY-MM-DD format"""
+    if not ISO_DATE_RE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
 
 def load_yaml_config(yaml_path):
     """Load the YAML configuration file"""
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        fd = os.open(yaml_path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size < MMAP_THRESHOLD:
+                return yaml.load(os.read(fd, MMAP_THRESHOLD), Loader=Loader)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=Loader)
+        finally:
+            os.close(fd)
     except FileNotFoundError:
         print(f"❌ Error: YAML config file not found: {yaml_path}")
         print("Please create tools/badge_certifications.yaml with your certification data")
@@ -23,38 +71,66 @@ def load_yaml_config(yaml_path):
         print(f"❌ Error parsing YAML file: {e}")
         return None
 
-def validate_certification(cert, badges_dir, category_metadata):
+def compile_cert_validator(category_metadata):
+    """Compile the structural cert checks into one fastjsonschema call.
+
+    Returns None when fastjsonschema is not installed; callers then rely
+    on the hand-rolled checks in validate_certification.
+    """
+    if fastjsonschema is None:
+        return None
+
+    date_pattern = r'^(\d{4}-\d{2}-\d{2})?$'  # optional fields may be ''
+    return fastjsonschema.compile({
+        'type': 'object',
+        'required': ['title', 'provider', 'category', 'badge_image'],
+        'properties': {
+            'title': {'type': 'string', 'minLength': 1},
+            'provider': {'type': 'string', 'minLength': 1},
+            'category': {'enum': sorted(category_metadata)},
+            'badge_image': {'type': 'string', 'minLength': 1},
+            'issue_date': {'type': 'string', 'pattern': date_pattern},
+            'expiry_date': {'type': 'string', 'pattern': date_pattern},
+        },
+    })
+
+def validate_certification(cert, badges_dir_str, category_metadata, existing_badges, validator=None):
     """Validate a certification entry"""
     errors = []
     warnings = []
 
-    # Required fields
-    required_fields = ['title', 'provider', 'category', 'badge_image']
-    for field in required_fields:
-        if not cert.get(field):
-            errors.append(f"Missing required field: {field}")
+    if validator is not None:
+        # One compiled call covers required fields, category and date shape
+        try:
+            validator(cert)
+        except fastjsonschema.JsonSchemaException as e:
+            return [e.message], warnings
+    else:
+        # Required fields
+        required_fields = ['title', 'provider', 'category', 'badge_image']
+        for field in required_fields:
+            if not cert.get(field):
+                errors.append(f"Missing required field: {field}")
 
-    if errors:
-        return errors, warnings
+        if errors:
+            return errors, warnings
 
-    # Validate category exists
-    category = cert['category']
-    if category not in category_metadata:
-        errors.append(f"Invalid category: {category}")
+        # Validate category exists
+        category = cert['category']
+        if category not in category_metadata:
+            errors.append(f"Invalid category: {category}")
 
-    # Check if badge image exists
+    # Check if badge image exists; the path string is only built when
+    # the file is actually missing
     badge_image = cert['badge_image']
-    badge_path = badges_dir / badge_image
-    if not badge_path.exists():
-        warnings.append(f"Badge image not found: {badge_path}")
+    if badge_image not in existing_badges:
+        warnings.append(f"Badge image not found: {badges_dir_str}/{badge_image}")
 
-    # Validate date formats if provided
+    # Validate date formats if provided (also range-checks dates whose
+    # shape already passed the compiled schema)
     for date_field in ['issue_date', 'expiry_date']:
-        if cert.get(date_field):
-            try:
-                datetime.strptime(cert[date_field], '%Y-%m-%d')
-            except ValueError:
-                errors.append(f"Invalid date format for {date_field}. Use YYYY-MM-DD")
+        if cert.get(date_field) and not is_iso_date(cert[date_field]):
+            errors.append(f"Invalid date format for {date_field}. Use YYYY-MM-DD")
 
     # Validate verification URL
     if not cert.get('verification_url') or 'YOUR-' in cert.get('verification_url', ''):
@@ -62,35 +138,53 @@ def validate_certification(cert, badges_dir, category_metadata):
 
     return errors, warnings
 
-def generate_fallback_svg(provider, title):
-    """Generate a fallback SVG placeholder based on provider"""
-    provider_colors = {
-        'Amazon Web Services': {'bg': '#232f3e', 'text': '#ff9900', 'short': 'AWS'},
-        'Google Cloud': {'bg': '#4285f4', 'text': 'white', 'short': 'GCP'},
-        'Coursera': {'bg': '#0056d2', 'text': 'white', 'short': 'Coursera'},
-        'Linux Foundation': {'bg': '#003366', 'text': '#ffffff', 'short': 'LF'},
-        'HashiCorp': {'bg': '#7B42BC', 'text': 'white', 'short': 'HC'},
-    }
-
-    config = provider_colors.get(provider, {'bg': '#4A90E2', 'text': 'white', 'short': 'CERT'})
-
-    svg = f"""data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='140' height='140'%3E%3Crect fill='{config['bg']}' width='140' height='140' rx='10'/%3E%3Ctext x='70' y='75' font-family='Arial' font-size='16' fill='{config['text']}' text-anchor='middle'%3E{config['short']}%3C/text%3E%3C/svg%3E"""
-
-    return svg
-
-def generate_badge_certifications_json(config, badges_dir, project_root):
+PROVIDER_COLORS = {
+    'Amazon Web Services': {'bg': '#232f3e', 'text': '#ff9900', 'short': 'AWS'},
+    'Google Cloud': {'bg': '#4285f4', 'text': 'white', 'short': 'GCP'},
+    'Coursera': {'bg': '#0056d2', 'text': 'white', 'short': 'Coursera'},
+    'Linux Foundation': {'bg': '#003366', 'text': '#ffffff', 'short': 'LF'},
+    'HashiCorp': {'bg': '#7B42BC', 'text': 'white', 'short': 'HC'},
+}
+
+DEFAULT_BADGE_STYLE = {'bg': '#4A90E2', 'text': 'white', 'short': 'CERT'}
+
+def _build_fallback_svg(style):
+    """Render one provider style as a percent-encoded SVG data URI"""
+    svg = (
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='140' height='140'>"
+        f"<rect fill='{style['bg']}' width='140' height='140' rx='10'/>"
+        f"<text x='70' y='75' font-family='Arial' font-size='16' "
+        f"fill='{style['text']}' text-anchor='middle'>{style['short']}</text>"
+        f"</svg>"
+    )
+    return 'data:image/svg+xml,' + quote(svg, safe='')
+
+# Precomputed at import: the URIs only depend on the provider style
+FALLBACK_SVGS = {p: _build_fallback_svg(s) for p, s in PROVIDER_COLORS.items()}
+DEFAULT_FALLBACK_SVG = _build_fallback_svg(DEFAULT_BADGE_STYLE)
+
+def generate_fallback_svg(provider):
+    """Fallback SVG placeholder data URI for a provider"""
+    return FALLBACK_SVGS.get(provider, DEFAULT_FALLBACK_SVG)
+
+def generate_badge_certifications_json(config, badges_dir, project_root, last_updated=None):
     """Generate badge_certifications.json from YAML config"""
 
     certifications = config.get('certifications', [])
     category_metadata = config.get('categories', {})
 
+    # Buffer all progress output and emit it in one write; per-line
+    # print() locking and flushing is measurable under redirected stdout
+    log = []
+
     if not certifications:
-        print("⚠️  Warning: No certifications found in YAML config")
+        log.append("⚠️  Warning: No certifications found in YAML config")
+        sys.stdout.write('\n'.join(log) + '\n')
         return {'categories': {}, 'total_count': 0}, 0
 
     # Initialize output structure
     output = {
-        'last_updated': datetime.now().isoformat(),
+        'last_updated': last_updated or datetime.now().isoformat(),
         'total_count': 0,
         'categories': {}
     }
@@ -99,94 +193,128 @@ def generate_badge_certifications_json(config, badges_dir, project_root):
     total_errors = 0
     total_warnings = 0
 
+    # One readdir up front instead of a stat() per certification, and a
+    # plain string for message formatting — no Path math in the loop
+    existing_badges = {entry.name for entry in os.scandir(badges_dir)}
+    badges_dir_str = str(badges_dir)
+
+    # Compiled once for the whole run; None if fastjsonschema is absent
+    validator = compile_cert_validator(category_metadata)
+
+    # Pre-build one bucket per declared category so the hot loop does a
+    # plain dict lookup instead of a guarded six-.get initialization
+    for category, cat_meta in category_metadata.items():
+        output['categories'][category] = {
+            'display_name': cat_meta.get('display_name', category.title()),
+            'icon': cat_meta.get('icon', '📄'),
+            'color': cat_meta.get('color', '#60A5FA'),
+            'description': cat_meta.get('description', ''),
+            'sort_order': cat_meta.get('sort_order', 999),
+            'count': 0,
+            'certifications': []
+        }
+
     # Process each certification
     for idx, cert in enumerate(certifications, 1):
         # Validate certification
-        errors, warnings = validate_certification(cert, badges_dir, category_metadata)
+        errors, warnings = validate_certification(cert, badges_dir_str, category_metadata, existing_badges, validator)
 
         if errors:
-            print(f"\n❌ Certification #{idx} ({cert.get('title', 'Unknown')}) has errors:")
-            for error in errors:
-                print(f"   - {error}")
+            log.append(f"\n❌ Certification #{idx} ({cert.get('title', 'Unknown')}) has errors:")
+            log.extend(f"   - {error}" for error in errors)
             total_errors += len(errors)
             continue  # Skip invalid entries
 
         if warnings:
-            print(f"\n⚠️  Certification #{idx} ({cert.get('title', 'Unknown')}) warnings:")
-            for warning in warnings:
-                print(f"   - {warning}")
+            log.append(f"\n⚠️  Certification #{idx} ({cert.get('title', 'Unknown')}) warnings:")
+            log.extend(f"   - {warning}" for warning in warnings)
             total_warnings += len(warnings)
 
-        # Extract certification data
+        # Extract certification data once; repeated dict lookups add up
+        # in this loop
         category = cert['category']
-
-        # Initialize category if not exists
-        if category not in output['categories']:
-            cat_meta = category_metadata.get(category, {})
-            output['categories'][category] = {
-                'display_name': cat_meta.get('display_name', category.title()),
-                'icon': cat_meta.get('icon', '📄'),
-                'color': cat_meta.get('color', '#60A5FA'),
-                'description': cat_meta.get('description', ''),
-                'sort_order': cat_meta.get('sort_order', 999),
-                'count': 0,
-                'certifications': []
-            }
+        badge_image = cert['badge_image']
+        issue_date = cert.get('issue_date')
+        expiry_date = cert.get('expiry_date')
+        credential_id = cert.get('credential_id')
+        description = cert.get('description')
 
         # Build certification entry
+        provider = cert['provider']
         cert_entry = {
             'title': cert['title'],
-            'provider': cert['provider'],
-            'badge_image': cert['badge_image'],
-            'badge_path': f'assets/badges/{cert["badge_image"]}',
+            'provider': provider,
+            'badge_image': badge_image,
+            'badge_path': f'assets/badges/{badge_image}',
             'verification_url': cert.get('verification_url', ''),
-            'fallback_svg': generate_fallback_svg(cert['provider'], cert['title']),
+            'fallback_svg': generate_fallback_svg(provider),
             'category': category
         }
 
         # Add optional fields if present and not empty
-        if cert.get('issue_date'):
-            cert_entry['issue_date'] = cert['issue_date']
-        if cert.get('expiry_date'):
-            cert_entry['expiry_date'] = cert['expiry_date']
-        if cert.get('credential_id'):
-            cert_entry['credential_id'] = cert['credential_id']
-        if cert.get('description'):
-            cert_entry['description'] = cert['description']
-
-        output['categories'][category]['certifications'].append(cert_entry)
-        output['categories'][category]['count'] += 1
+        if issue_date:
+            cert_entry['issue_date'] = issue_date
+        if expiry_date:
+            cert_entry['expiry_date'] = expiry_date
+        if credential_id:
+            cert_entry['credential_id'] = credential_id
+        if description:
+            cert_entry['description'] = description
+
+        bucket = output['categories'][category]
+        bucket['certifications'].append(cert_entry)
+        bucket['count'] += 1
         output['total_count'] += 1
 
-    # Sort categories by sort_order
-    sorted_categories = dict(sorted(
-        output['categories'].items(),
-        key=lambda x: x[1]['sort_order']
-    ))
-    output['categories'] = sorted_categories
+    # Drop declared categories that ended up with no valid certs so the
+    # JSON only lists categories the page should render
+    output['categories'] = {
+        name: data for name, data in output['categories'].items() if data['count']
+    }
 
-    # Sort certifications within each category by issue_date (newest first)
-    for category in output['categories'].values():
-        category['certifications'].sort(
-            key=lambda x: x.get('issue_date', '1970-01-01'),
-            reverse=True
+    # Sort categories by sort_order; decorated tuples compare in C with
+    # no per-comparison key-function call
+    output['categories'] = {
+        name: data
+        for _, name, data in sorted(
+            (data['sort_order'], name, data)
+            for name, data in output['categories'].items()
         )
+    }
 
-    # Print summary
-    print("\n" + "="*60)
-    print("🏆 Badge Certification Generation Summary")
-    print("="*60)
-    print(f"✅ Total Certifications: {output['total_count']}")
-    print(f"📁 Categories: {len(output['categories'])}")
+    # Sort certifications within each category by issue_date (newest
+    # first). itemgetter needs the key present, so fill undated entries
+    # with a sentinel and strip it again after sorting — the JSON must
+    # not ship a fake date.
+    issue_date_key = itemgetter('issue_date')
+    for category in output['categories'].values():
+        certs = category['certifications']
+        for entry in certs:
+            entry.setdefault('issue_date', UNDATED)
+        certs.sort(key=issue_date_key, reverse=True)
+        for entry in certs:
+            if entry['issue_date'] == UNDATED:
+                del entry['issue_date']
+
+    # Summary
+    log.append("\n" + "="*60)
+    log.append("🏆 Badge Certification Generation Summary")
+    log.append("="*60)
+    log.append(f"✅ Total Certifications: {output['total_count']}")
+    log.append(f"📁 Categories: {len(output['categories'])}")
 
     if total_errors > 0:
-        print(f"❌ Errors: {total_errors}")
+        log.append(f"❌ Errors: {total_errors}")
     if total_warnings > 0:
-        print(f"⚠️  Warnings: {total_warnings}")
+        log.append(f"⚠️  Warnings: {total_warnings}")
+
+    log.append("\nCertifications by Category:")
+    log.extend(
+        f"  {data['icon']} {data['display_name']}: {data['count']} certifications"
+        for data in output['categories'].values()
+    )
 
-    print("\nCertifications by Category:")
-    for category, data in output['categories'].items():
-        print(f"  {data['icon']} {data['display_name']}: {data['count']} certifications")
+    sys.stdout.write('\n'.join(log) + '\n')
 
     return output, total_errors
 
@@ -201,6 +329,22 @@ def main():
     print("🔄 Generating badge certifications metadata from YAML...")
     print(f"📄 Reading config: {yaml_path}")
 
+    # Skip the whole run when the config is unchanged since the last
+    # one — useful under pre-commit hooks. The output is deterministic
+    # (last_updated comes from the YAML mtime), so a matching hash means
+    # the JSON on disk is already current.
+    yaml_hash = None
+    hash_file = output_file.with_name(output_file.name + '.hash')
+    if yaml_path.exists():
+        yaml_hash = hashlib.blake2b(yaml_path.read_bytes(), digest_size=16).hexdigest()
+        if (output_file.exists() and hash_file.exists()
+                and hash_file.read_text().strip() == yaml_hash):
+            print(f"✅ {output_file.name} is up to date (config unchanged)")
+            return 0
+        last_updated = datetime.fromtimestamp(yaml_path.stat().st_mtime).isoformat()
+    else:
+        last_updated = None
+
     # Ensure badges directory exists
     badges_dir.mkdir(parents=True, exist_ok=True)
     print(f"📁 Badge images directory: {badges_dir}")
@@ -211,16 +355,23 @@ def main():
         return 1
 
     # Generate badge_certifications.json
-    output, error_count = generate_badge_certifications_json(config, badges_dir, project_root)
+    output, error_count = generate_badge_certifications_json(config, badges_dir, project_root, last_updated)
 
     if error_count > 0:
         print(f"\n❌ Generation completed with {error_count} errors")
         print("⚠️  Fix the errors above and run again")
         return 1
 
-    # Write JSON output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # Write JSON output (orjson when available, stdlib otherwise)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+
+    if yaml_hash is not None:
+        hash_file.write_text(yaml_hash)
 
     print(f"\n✅ Successfully generated: {output_file}")
     print("\n📝 Next Steps:")